@@ -19,7 +19,8 @@ class Node:
         return self.f_cost < other.f_cost
 
 class AStarPlanner:
-    def __init__(self, weather_data, physics_engine: ShipPhysics):
+    def __init__(self, weather_data, physics_engine: Optional[ShipPhysics] = None):
+        # physics_engine may be omitted when every plan() call supplies a fuel_rate_grid
         self.weather = weather_data
         self.physics = physics_engine
         
@@ -54,7 +55,11 @@ class AStarPlanner:
                 
         return neighbors
 
-    def plan(self, start_idx: Tuple[int, int], goal_idx: Tuple[int, int], speed_knots: float = 15.0):
+    def plan(self, start_idx: Tuple[int, int], goal_idx: Tuple[int, int], speed_knots: float = 15.0,
+             fuel_rate_grid: Optional[np.ndarray] = None):
+        # fuel_rate_grid: precomputed fuel burn (MT/h) per grid cell, skips the per-edge weather lookup
+        if fuel_rate_grid is None and self.physics is None:
+            raise ValueError("Need a physics engine or a fuel rate grid.")
 
         open_list = []
         start_node = Node(start_idx[0], start_idx[1], 0.0)
@@ -85,21 +90,22 @@ class AStarPlanner:
 
             for n_lat, n_lon in self.get_neighbors(current):
                 
-                try:
-                    u_wind = self.weather['u_wind'].isel(time=0, lat=n_lat, lon=n_lon).item()
-                    v_wind = self.weather['v_wind'].isel(time=0, lat=n_lat, lon=n_lon).item()
-                    wave_h = self.weather['wave_height'].isel(time=0, lat=n_lat, lon=n_lon).item()
-                except Exception:
-                    continue
-
-                weather_snapshot = {
-                    "u_wind": u_wind, 
-                    "v_wind": v_wind, 
-                    "wave_height": wave_h
-                }
-                fuel_rate_mt_h =self.physics.calculate_fuel_consumption(speed_knots, weather_snapshot)
-
-                fuel_rate_mt_h = self.physics.calculate_fuel_consumption(speed_knots, weather_snapshot)
+                if fuel_rate_grid is not None:
+                    fuel_rate_mt_h = fuel_rate_grid[n_lat, n_lon]
+                else:
+                    try:
+                        u_wind = self.weather['u_wind'].isel(time=0, lat=n_lat, lon=n_lon).item()
+                        v_wind = self.weather['v_wind'].isel(time=0, lat=n_lat, lon=n_lon).item()
+                        wave_h = self.weather['wave_height'].isel(time=0, lat=n_lat, lon=n_lon).item()
+                    except Exception:
+                        continue
+
+                    weather_snapshot = {
+                        "u_wind": u_wind, 
+                        "v_wind": v_wind, 
+                        "wave_height": wave_h
+                    }
+                    fuel_rate_mt_h = self.physics.calculate_fuel_consumption(speed_knots, weather_snapshot)
                 
                 is_diagonal = (current.lat_idx != n_lat) and (current.lon_idx != n_lon)
                 dist_km = 55.0 * (1.414 if is_diagonal else 1.0)
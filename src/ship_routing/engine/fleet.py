@@ -0,0 +1,78 @@
+import numpy as np
+import xarray as xr
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple, Optional, Sequence, Union
+from ship_routing.engine.astar__c import AStarPlanner
+from ship_routing.engine.physics import FleetPhysics
+
+_worker_planner: Optional[AStarPlanner] = None
+
+
+def _init_worker(grid):
+    global _worker_planner
+    # Every task brings its own fuel rate grid, so workers need no physics engine
+    _worker_planner = AStarPlanner(grid)
+
+
+def _plan_vessel(task):
+    fuel_rate_grid, start_idx, goal_idx, speed_knots = task
+    return _worker_planner.plan(start_idx, goal_idx, speed_knots=speed_knots, fuel_rate_grid=fuel_rate_grid)
+
+
+class FleetPlanner:
+    """Routes a whole fleet against one forecast.
+
+    Per-vessel cost rasters come from a single batched FleetPhysics call and the
+    A* searches then run in parallel worker processes on those rasters.
+    """
+
+    def __init__(self, weather_data, fleet: FleetPhysics):
+        self.weather = weather_data
+        self.fleet = fleet
+
+        # Workers only need the grid, not the full forecast
+        self.grid = xr.Dataset(coords={
+            'lat': weather_data.coords['lat'].values,
+            'lon': weather_data.coords['lon'].values,
+        })
+
+    def cost_rasters(self, speed_knots: Union[float, Sequence[float]], time_idx: int = 0) -> np.ndarray:
+
+        snapshot = self.weather.isel(time=time_idx)
+        weather_snapshot = {
+            "u_wind": snapshot['u_wind'].values,
+            "v_wind": snapshot['v_wind'].values,
+            "wave_height": snapshot['wave_height'].values,
+        }
+        return self.fleet.calculate_fuel_rasters(speed_knots, weather_snapshot)
+
+    def plan(
+        self,
+        start_idxs: Sequence[Tuple[int, int]],
+        goal_idxs: Sequence[Tuple[int, int]],
+        speed_knots: Optional[Union[float, Sequence[float]]] = None,
+        max_workers: Optional[int] = None,
+    ) -> List:
+        """Returns one A* result, (path, fuel), per vessel. `speed_knots` defaults to each design speed."""
+
+        n_vessels = len(self.fleet)
+        if len(start_idxs) != n_vessels or len(goal_idxs) != n_vessels:
+            raise ValueError("Need one start and one goal per vessel.")
+
+        if speed_knots is None:
+            speed_knots = self.fleet.design_speed
+        speeds = np.broadcast_to(np.asarray(speed_knots, dtype=float), (n_vessels,))
+
+        rasters = self.cost_rasters(speeds)
+        tasks = [
+            (rasters[i], tuple(start_idxs[i]), tuple(goal_idxs[i]), float(speeds[i]))
+            for i in range(n_vessels)
+        ]
+
+        if max_workers == 1:
+            _init_worker(self.grid)
+            return [_plan_vessel(task) for task in tasks]
+
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=(self.grid,)) as executor:
+            return list(executor.map(_plan_vessel, tasks))
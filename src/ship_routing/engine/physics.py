@@ -1,5 +1,5 @@
 import numpy as np
-from typing import Dict, Union
+from typing import Dict, List, Union
 
 class ShipPhysics: 
 
@@ -38,7 +38,10 @@ class ShipPhysics:
         return wind_resistance
     
     def wave_resistance(self, wave_height): 
-        resistance = 1500 * (wave_height**2) * self.width
+        return self.wave_resistance_from_sq(wave_height**2)
+
+    def wave_resistance_from_sq(self, wave_height_sq):
+        resistance = 1500 * wave_height_sq * self.width
         return resistance
 
     def calculate_fuel_consumption(self, speed_knots, weather_data: dict[str, float]):
@@ -48,7 +51,11 @@ class ShipPhysics:
         wind_speed = np.sqrt(u_wind**2 + v_wind**2)
 
         wave_height = weather_data["wave_height"] 
-        total_resistance = self.get_calm_water_resistance(speed_knots) + self.get_wind_resistance(speed_knots, wind_speed) + self.wave_resistance(wave_height)
+        return self.fuel_from_fields(speed_knots, wind_speed, wave_height**2)
+
+    def fuel_from_fields(self, speed_knots, wind_speed, wave_height_sq):
+        # Fuel burn (MT/h) from already derived wind speed and squared wave height
+        total_resistance = self.get_calm_water_resistance(speed_knots) + self.get_wind_resistance(speed_knots, wind_speed) + self.wave_resistance_from_sq(wave_height_sq)
         speed_ms = self.knots_to_ms(speed_knots)
 
         effective_power = total_resistance * speed_ms
@@ -59,3 +66,57 @@ class ShipPhysics:
     
 
 
+class FleetPhysics:
+    """ShipPhysics for a whole fleet: every hull parameter holds one entry per vessel."""
+
+    def __init__(self, length, width, draft, block_coeff, design_speed):
+        self.length, self.width, self.draft, self.block_coeff, self.design_speed = np.broadcast_arrays(
+            *(np.atleast_1d(np.asarray(p, dtype=float)) for p in (length, width, draft, block_coeff, design_speed))
+        )
+
+    @classmethod
+    def from_ships(cls, ships: List[ShipPhysics]):
+        return cls(
+            [s.length for s in ships],
+            [s.width for s in ships],
+            [s.draft for s in ships],
+            [s.block_coeff for s in ships],
+            [s.design_speed for s in ships],
+        )
+
+    def __len__(self):
+        return len(self.length)
+
+    def vessel(self, idx: int) -> ShipPhysics:
+        return ShipPhysics(
+            length=self.length[idx],
+            width=self.width[idx],
+            draft=self.draft[idx],
+            block_coeff=self.block_coeff[idx],
+            design_speed=self.design_speed[idx],
+        )
+
+    def hulls(self, grid_ndim: int = 0) -> ShipPhysics:
+        # One ShipPhysics whose parameters broadcast as (vessels, *grid)
+        shape = (-1,) + (1,) * grid_ndim
+        return ShipPhysics(
+            length=self.length.reshape(shape),
+            width=self.width.reshape(shape),
+            draft=self.draft.reshape(shape),
+            block_coeff=self.block_coeff.reshape(shape),
+            design_speed=self.design_speed.reshape(shape),
+        )
+
+    def calculate_fuel_rasters(self, speed_knots, weather_data: dict[str, np.ndarray]):
+        """Fuel burn (MT/h) of every vessel over a weather grid, shape (vessels, *grid)."""
+
+        # Weather terms do not depend on the hull, so they are computed once for the fleet
+        wind_speed = np.sqrt(weather_data["u_wind"]**2 + weather_data["v_wind"]**2)
+        wave_height_sq = weather_data["wave_height"]**2
+
+        grid_ndim = np.ndim(wave_height_sq)
+        speed_knots = np.broadcast_to(np.asarray(speed_knots, dtype=float), self.length.shape)
+
+        return self.hulls(grid_ndim).fuel_from_fields(
+            speed_knots.reshape((-1,) + (1,) * grid_ndim), wind_speed, wave_height_sq
+        )
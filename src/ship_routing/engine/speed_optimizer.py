@@ -0,0 +1,191 @@
+import numpy as np
+import pandas as pd
+import xarray as xr
+from typing import List, Tuple, Optional, Sequence
+from ship_routing.engine.physics import ShipPhysics
+
+
+class SpeedOptimizer:
+    """Picks a speed per segment of a fixed route so the voyage lands inside an
+    ETA window for the least fuel.
+
+    Dynamic programming runs over (waypoint, arrival time bin). The fuel of every
+    segment / departure hour / speed level combination is evaluated in one
+    vectorized call to the physics engine before the recursion starts.
+    """
+
+    def __init__(self, weather_data, physics_engine: ShipPhysics):
+        self.weather = weather_data
+        self.physics = physics_engine
+
+        self.times = pd.to_datetime(weather_data.coords['time'].values)
+
+    def segment_distances(self, waypoints: np.ndarray) -> np.ndarray:
+
+        start_wp = waypoints[:-1]
+        end_wp = waypoints[1:]
+
+        avg_lat = np.radians((start_wp[:, 0] + end_wp[:, 0]) / 2.0)
+        lat_diff_nm = (end_wp[:, 0] - start_wp[:, 0]) * 60.0
+        lon_diff_nm = (end_wp[:, 1] - start_wp[:, 1]) * 60.0 * np.cos(avg_lat)
+
+        return np.sqrt(lat_diff_nm**2 + lon_diff_nm**2)
+
+    def segment_weather(self, waypoints: np.ndarray) -> dict:
+        # Weather for every segment midpoint at every forecast hour, shape (segments, time)
+        mid = (waypoints[:-1] + waypoints[1:]) / 2.0
+        mid_lats = xr.DataArray(mid[:, 0], dims='segment')
+        mid_lons = xr.DataArray(mid[:, 1], dims='segment')
+
+        snapshot = {}
+        for var in ("u_wind", "v_wind", "wave_height"):
+            field = self.weather[var].sel(lat=mid_lats, lon=mid_lons, method="nearest")
+            snapshot[var] = field.transpose('segment', 'time').values
+        return snapshot
+
+    def merge_short_segments(self, fastest_hours: np.ndarray, time_step_hours: float) -> List[np.ndarray]:
+        # Group consecutive segments until the group takes at least one time step at top
+        # speed; a short tail (or zero-length segment) joins the group before it.
+        legs, members, hours = [], [], 0.0
+        for j, seg_time in enumerate(fastest_hours):
+            members.append(j)
+            hours += seg_time
+            if hours >= time_step_hours:
+                legs.append(members)
+                members, hours = [], 0.0
+
+        if members:
+            if legs:
+                legs[-1].extend(members)
+            else:
+                legs.append(members)
+        return [np.array(leg) for leg in legs]
+
+    def optimize(
+        self,
+        waypoints: Sequence[Tuple[float, float]],
+        eta_window_hours: Tuple[float, float],
+        speed_levels: Optional[Sequence[float]] = None,
+        departure_time: Optional[str] = None,
+        time_step_hours: float = 0.5,
+    ):
+        """Returns (speed per segment in knots, arrival hours per waypoint, total fuel in tns).
+
+        `time_step_hours` is the resolution of the arrival time grid.
+        Only the cheapest label per bin survives, so a stage must always advance at least
+        one bin: consecutive segments shorter than a step at top speed (including
+        zero-length ones) are sailed at one shared speed. `departure_time` must lie in
+        the forecast; legs that start after its last hour use that last hour.
+        """
+
+        waypoints = np.asarray(waypoints, dtype=float)
+        if len(waypoints) < 2:
+            raise ValueError("Route needs at least two waypoints.")
+
+        if speed_levels is None:
+            speed_levels = np.linspace(5.0, 25.0, 20)
+        speeds = np.asarray(speed_levels, dtype=float)
+        if speeds.size == 0 or np.any(speeds <= 0):
+            raise ValueError("Speed levels must be positive.")
+
+        eta_min, eta_max = eta_window_hours
+        if eta_min > eta_max:
+            raise ValueError("ETA window lower bound exceeds upper bound.")
+
+        departure = self.times[0] if departure_time is None else pd.to_datetime(departure_time)
+        if not self.times[0] <= departure <= self.times[-1]:
+            raise ValueError("Departure time is outside the forecast range.")
+
+        if time_step_hours <= 0:
+            raise ValueError("Time step must be positive.")
+
+        dist_nm = self.segment_distances(waypoints)
+        n_segments = len(dist_nm)
+
+        # Sailing time per segment and speed
+        seg_hours = dist_nm[:, None] / speeds[None, :]
+
+        # Fuel per (segment, forecast hour, speed) in a single vectorized pass
+        weather = self.segment_weather(waypoints)
+        weather = {k: v[:, :, None] for k, v in weather.items()}
+        fuel_rate = self.physics.calculate_fuel_consumption(speeds[None, None, :], weather)
+        fuel_table = fuel_rate * seg_hours[:, None, :]
+
+        # Elapsed hours at which the nearest forecast hour switches to the next one
+        offsets_h = np.asarray((self.times - departure) / pd.Timedelta(hours=1))
+        forecast_edges = (offsets_h[1:] + offsets_h[:-1]) / 2.0
+
+        # DP stages are legs of whole segments sailed at one speed, each at least one bin long
+        legs = self.merge_short_segments(seg_hours.min(axis=1), time_step_hours)
+        leg_hours = np.array([seg_hours[members].sum(axis=0) for members in legs])
+        leg_bins = leg_hours / time_step_hours
+        whole_bins = np.floor(leg_bins).astype(np.int64)
+        part_bins = leg_bins - whole_bins
+
+        n_legs = len(legs)
+        n_bins = int(np.floor(eta_max / time_step_hours)) + 1
+        bin_idx = np.arange(n_bins)
+
+        # Each bin keeps the exact arrival time of its best label, so rounding to
+        # the grid never accumulates along the route.
+        cost = np.full(n_bins, np.inf)
+        cost[0] = 0.0
+        exact = np.zeros(n_bins)
+        choice = np.zeros((n_legs, n_bins), dtype=np.int16)
+        prev = np.zeros((n_legs, n_bins), dtype=np.int32)
+
+        speed_idx = np.arange(len(speeds))
+
+        for i, members in enumerate(legs):
+            rows = np.flatnonzero(np.isfinite(cost))
+            frac = exact[rows] / time_step_hours - rows
+
+            # Arrival bin and cost for every reachable bin x speed level at once,
+            # pricing each segment at the forecast for its real departure time
+            target = rows[:, None] + whole_bins[i] + ((frac[:, None] + part_bins[i]) >= 1.0)
+            arriving = np.repeat(cost[rows, None], len(speeds), axis=1)
+            departs = np.repeat(exact[rows, None], len(speeds), axis=1)
+            for j in members:
+                weather_idx = np.searchsorted(forecast_edges, departs)
+                arriving += fuel_table[j, weather_idx, speed_idx]
+                departs += seg_hours[j]
+            source = np.broadcast_to(rows[:, None], target.shape)
+            level = np.broadcast_to(speed_idx, target.shape)
+
+            keep = target < n_bins
+            target, arriving = target[keep], arriving[keep]
+            source, level = source[keep], level[keep]
+
+            new_cost = np.full(n_bins, np.inf)
+            np.minimum.at(new_cost, target, arriving)
+
+            winners = np.flatnonzero(arriving == new_cost[target])
+            bins, first = np.unique(target[winners], return_index=True)
+            winners = winners[first]
+
+            choice[i, bins] = level[winners]
+            prev[i, bins] = source[winners]
+            new_exact = np.zeros(n_bins)
+            new_exact[bins] = exact[source[winners]] + leg_hours[i, level[winners]]
+
+            cost = new_cost
+            exact = new_exact
+
+        in_window = (exact >= eta_min) & (exact <= eta_max) & np.isfinite(cost)
+        if not in_window.any():
+            raise ValueError("No speed profile reaches the destination inside the ETA window.")
+
+        end_bin = bin_idx[in_window][np.argmin(cost[in_window])]
+        total_fuel = cost[end_bin]
+
+        profile = np.empty(n_segments, dtype=int)
+        k = end_bin
+        for i in range(n_legs - 1, -1, -1):
+            profile[legs[i]] = choice[i, k]
+            k = prev[i, k]
+
+        speed_profile = speeds[profile]
+        arrival_hours = np.concatenate(([0.0], np.cumsum(seg_hours[np.arange(n_segments), profile])))
+
+        print(f"Completed,Speed profile fuel consumption is: {total_fuel:.2f} tns, ETA {arrival_hours[-1]:.1f} h")
+        return speed_profile, arrival_hours, total_fuel
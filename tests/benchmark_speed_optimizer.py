@@ -0,0 +1,23 @@
+import time
+import numpy as np
+from ship_routing.data_pipeline.loader import WeatherLoader
+from ship_routing.engine.physics import ShipPhysics
+from ship_routing.engine.speed_optimizer import SpeedOptimizer
+
+def run_benchmark():
+    loader = WeatherLoader()
+    loader.generate_synthetic_data()
+    optimizer = SpeedOptimizer(loader.dataset, ShipPhysics())
+
+    # 1,000 legs x 20 speed levels, the target is well under a second
+    waypoints = np.column_stack([np.linspace(-5.0, 25.0, 1001), np.linspace(55.0, 95.0, 1001)])
+
+    t0 = time.time()
+    speeds, arrival_hours, fuel = optimizer.optimize(waypoints, eta_window_hours=(190.0, 200.0))
+    elapsed = time.time() - t0
+
+    print(f"Optimized {len(speeds)} segments x 20 speed levels in {elapsed:.3f}s")
+    print(f"Fuel: {fuel:.2f} tns | ETA: {arrival_hours[-1]:.1f} h")
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,43 @@
+import numpy as np
+from ship_routing.data_pipeline.loader import WeatherLoader
+from ship_routing.engine.physics import ShipPhysics, FleetPhysics
+from ship_routing.engine.fleet import FleetPlanner
+from ship_routing.engine.astar__c import AStarPlanner
+
+def test_fleet_routing():
+    loader = WeatherLoader()
+    loader.generate_synthetic_data()
+
+    ships = [
+        ShipPhysics(length=200, width=32, draft=12, design_speed=15),
+        ShipPhysics(length=300, width=40, draft=14, design_speed=20),
+        ShipPhysics(length=150, width=25, draft=9, block_coeff=0.7, design_speed=12),
+    ]
+    fleet = FleetPhysics.from_ships(ships)
+    planner = FleetPlanner(loader.dataset, fleet)
+
+    # Batched rasters must match the single-hull physics cell by cell
+    rasters = planner.cost_rasters(fleet.design_speed)
+    snapshot = loader.dataset.isel(time=0)
+    weather = {k: snapshot[k].values for k in ("u_wind", "v_wind", "wave_height")}
+    for i, ship in enumerate(ships):
+        expected = fleet.vessel(i).calculate_fuel_consumption(ship.design_speed, weather)
+        assert np.allclose(rasters[i], expected)
+
+    results = planner.plan([(10, 10)] * 3, [(20, 25)] * 3, max_workers=2)
+
+    assert len(results) == 3
+    for path, fuel in results:
+        assert path[0] == (10, 10) and path[-1] == (20, 25)
+        assert fuel > 0
+
+    # In-process planning gives the same routes
+    assert planner.plan([(10, 10)] * 3, [(20, 25)] * 3, max_workers=1) == results
+
+    # And each route matches a plain single-ship A* run with that vessel's hull
+    path, fuel = AStarPlanner(loader.dataset, fleet.vessel(1)).plan((10, 10), (20, 25), speed_knots=fleet.design_speed[1])
+    assert results[1][0] == path
+    assert np.isclose(results[1][1], fuel)
+
+if __name__ == "__main__":
+    test_fleet_routing()
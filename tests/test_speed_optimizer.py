@@ -0,0 +1,97 @@
+import itertools
+import numpy as np
+import pytest
+from ship_routing.data_pipeline.loader import WeatherLoader
+from ship_routing.engine.physics import ShipPhysics
+from ship_routing.engine.speed_optimizer import SpeedOptimizer
+
+def make_optimizer():
+    np.random.seed(0)
+    loader = WeatherLoader()
+    loader.generate_synthetic_data()
+    return SpeedOptimizer(loader.dataset, ShipPhysics())
+
+def test_speed_profile():
+    optimizer = make_optimizer()
+
+    # 1,000 legs of about 3 nm between (5S, 55E) and (25N, 95E), default time step
+    waypoints = np.column_stack([np.linspace(-5.0, 25.0, 1001), np.linspace(55.0, 95.0, 1001)])
+
+    for window in [(190.0, 200.0), (150.0, 200.0), (100.0, 300.0)]:
+        speeds, arrival_hours, fuel = optimizer.optimize(waypoints, eta_window_hours=window)
+
+        assert len(speeds) == 1000
+        assert window[0] <= arrival_hours[-1] <= window[1]
+        assert fuel > 0
+
+def test_speed_profile_matches_brute_force():
+    optimizer = make_optimizer()
+    physics = optimizer.physics
+
+    waypoints = np.array([(10.0, 60.0), (11.0, 62.5), (12.5, 64.0), (13.5, 67.0), (15.0, 70.0)])
+    levels = np.array([10.0, 12.5, 15.0, 17.5, 20.0])
+    window = (35.0, 45.0)
+
+    dist_nm = optimizer.segment_distances(waypoints)
+    weather = optimizer.segment_weather(waypoints)
+
+    def voyage(profile):
+        # Fuel and ETA with each leg priced at the forecast hour nearest its real departure
+        hours, fuel = 0.0, 0.0
+        for i, speed in enumerate(profile):
+            hour = int(np.clip(np.rint(hours), 0, len(optimizer.times) - 1))
+            snapshot = {k: v[i, hour] for k, v in weather.items()}
+            leg_hours = dist_nm[i] / speed
+            fuel += physics.calculate_fuel_consumption(speed, snapshot) * leg_hours
+            hours += leg_hours
+        return fuel, hours
+
+    best = min(
+        fuel for fuel, hours in map(voyage, itertools.product(levels, repeat=4))
+        if window[0] <= hours <= window[1]
+    )
+
+    speeds, arrival_hours, fuel = optimizer.optimize(waypoints, window, speed_levels=levels)
+
+    assert np.isclose(fuel, best)
+    assert np.isclose(voyage(speeds)[0], fuel)
+    assert np.isclose(voyage(speeds)[1], arrival_hours[-1])
+
+def test_short_and_zero_length_segments():
+    optimizer = make_optimizer()
+
+    # Benchmark route with one 0.03 nm leg and one repeated waypoint inserted
+    waypoints = np.column_stack([np.linspace(-5.0, 25.0, 1001), np.linspace(55.0, 95.0, 1001)])
+    step = waypoints[501] - waypoints[500]
+    waypoints = np.insert(waypoints, 501, waypoints[500] + 0.0005 * step / np.abs(step).max(), axis=0)
+    waypoints = np.insert(waypoints, 700, waypoints[700], axis=0)
+
+    speeds, arrival_hours, fuel = optimizer.optimize(waypoints, eta_window_hours=(190.0, 200.0))
+
+    assert len(speeds) == len(waypoints) - 1
+    assert len(arrival_hours) == len(waypoints)
+    assert 190.0 <= arrival_hours[-1] <= 200.0
+    assert arrival_hours[701] == arrival_hours[700]
+
+    speeds, arrival_hours, fuel = optimizer.optimize([(10.0, 60.0), (10.0, 60.0), (15.0, 70.0)], (20.0, 60.0))
+
+    assert len(speeds) == 2 and speeds[0] == speeds[1]
+    assert arrival_hours[1] == 0.0
+    assert 20.0 <= arrival_hours[-1] <= 60.0
+
+def test_invalid_inputs():
+    optimizer = make_optimizer()
+    waypoints = np.array([(10.0, 60.0), (15.0, 70.0)])
+
+    with pytest.raises(ValueError):
+        optimizer.optimize(waypoints, (20.0, 60.0), speed_levels=[0.0, 10.0])
+    with pytest.raises(ValueError):
+        optimizer.optimize(waypoints, (20.0, 60.0), speed_levels=[-5.0, 10.0])
+    with pytest.raises(ValueError):
+        optimizer.optimize(waypoints, (20.0, 60.0), time_step_hours=0.0)
+    with pytest.raises(ValueError):
+        optimizer.optimize(waypoints, (20.0, 60.0), departure_time="2027-01-01")
+
+if __name__ == "__main__":
+    test_speed_profile()
+    test_speed_profile_matches_brute_force()